@@ -5,7 +5,7 @@ import enum
 import pulp as pl
 import tabulate
 
-from . import board, enums, information
+from . import board, enums, information, propagation
 
 
 class Game:
@@ -41,15 +41,15 @@ class Game:
         }
         self._iteration_count = 0
 
-    def _info_to_constraint(self, info):
+    def _info_to_constraints(self, info: information.Info) -> list[pl.LpConstraint]:
         if isinstance(info, information.UniqueLocationInfo):
-            for t in self._board.terrains:
-                for d in self._board.directions:
-                    self._problem.addConstraint(
-                        pl.lpSum(self._board.locations[(p, t, d)] for p in self._board.players) == 1
-                    )
+            return [
+                pl.lpSum(self._board.locations[(p, t, d)] for p in self._board.players) == 1
+                for t in self._board.terrains
+                for d in self._board.directions
+            ]
         elif isinstance(info, information.SingleInfo):
-            self._problem.addConstraint(pl.lpSum(self._board.get_location(info.player, info.name)) == int(info.present))
+            return [pl.lpSum(self._board.get_location(info.player, info.name)) == int(info.present)]
         elif isinstance(info, information.RangeInfo):
             if info.terrain == "A":
                 locs = [
@@ -61,17 +61,35 @@ class Game:
                 ]
             else:
                 locs = self._board.get_locations(info.player, info.terrain, info.start, info.end)
-            self._problem.addConstraint(pl.lpSum(locs) == info.amount)
+            return [pl.lpSum(locs) == info.amount]
         elif isinstance(info, information.LeastTerrainInfo):
-            for t in self._board.terrains:
-                if t.value != info.terrain:
-                    self._problem.addConstraint(
-                        pl.lpSum(self._board.get_locations(info.player, info.terrain, 1, 1))
-                        <= pl.lpSum(self._board.get_locations(info.player, t.value, 1, 1))
-                    )
+            return [
+                pl.lpSum(self._board.get_locations(info.player, info.terrain, 1, 1))
+                <= pl.lpSum(self._board.get_locations(info.player, t.value, 1, 1))
+                for t in self._board.terrains
+                if t.value != info.terrain
+            ]
         else:
             raise ValueError(f"Unknown information type: {type(info)}")
 
+    def _is_feasible(self, rules: propagation.Propagator, constraints: list[pl.LpConstraint]) -> bool:
+        state = rules.copy()
+        if not state.add(constraints):
+            return False
+        result = state.search()
+        if result is not None:
+            return result
+
+        # search gave up, fall back to the full solver
+        problem = pl.LpProblem(sense=pl.LpMaximize)
+        for info in self._rules:
+            for constraint in self._info_to_constraints(info):
+                problem.addConstraint(constraint)
+        for constraint in constraints:
+            problem.addConstraint(constraint)
+        problem.solve(pl.PULP_CBC_CMD(msg=0))
+        return problem.status == pl.LpStatusOptimal
+
     @property
     def info(self) -> list[information.Info]:
         return self._rules + self._info
@@ -82,6 +100,11 @@ class Game:
                 print("Not solved")
             elif self._problem.status == pl.LpStatusInfeasible:
                 print("No solution found")
+                conflict = self.find_conflict()
+                if conflict:
+                    print("Conflicting information:")
+                    for info in conflict:
+                        print(f"  {info}")
             return
 
         print("=" * 50)
@@ -102,7 +125,8 @@ class Game:
 
         # add constraints from information
         for info in self.info:
-            self._info_to_constraint(info)
+            for constraint in self._info_to_constraints(info):
+                self._problem.addConstraint(constraint)
 
         # solve until infeasible/max iterations reached
         for _ in range(max_iterations):
@@ -133,6 +157,35 @@ class Game:
     def get_result(self) -> dict:
         return self._aggregated
 
+    def find_conflict(self) -> list[information.Info] | None:
+        """Find a minimal subset of the given information that contradicts the rules.
+
+        Information is dropped one at a time, keeping only the pieces without which the rest
+        would become consistent. Each check runs on the propagation engine, and CBC is only
+        called when its search gives up.
+
+        Returns:
+            list[information.Info] | None: Conflicting information, or None if it is consistent.
+        """
+        rules = propagation.Propagator(
+            constraint for info in self._rules for constraint in self._info_to_constraints(info)
+        )
+        constraints = [self._info_to_constraints(info) for info in self._info]
+
+        def _feasible(indices: list[int]) -> bool:
+            return self._is_feasible(rules, [constraint for i in indices for constraint in constraints[i]])
+
+        indices = list(range(len(self._info)))
+        if _feasible(indices):
+            return None
+
+        for i in list(indices):
+            remaining = [j for j in indices if j != i]
+            if not _feasible(remaining):
+                indices = remaining
+
+        return [self._info[i] for i in indices]
+
 
 class StandardGame(Game):
     """Representation of a standard game with official rules."""
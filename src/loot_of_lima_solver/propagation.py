@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import pulp as pl
+
+
+class Propagator:
+    """Bound propagation and search over linear constraints on binary variables."""
+
+    def __init__(self, constraints: Iterable[pl.LpConstraint] = ()):
+        """Constructor of `Propagator` class.
+
+        Args:
+            constraints (Iterable[pl.LpConstraint]): Initial constraints.
+        """
+        self._rows: list[tuple[tuple[tuple[pl.LpVariable, float], ...], float]] = []
+        self._watches: dict[pl.LpVariable, list[int]] = {}
+        self._values: dict[pl.LpVariable, int] = {}
+        self._feasible: bool = True
+
+        self.add(constraints)
+
+    @property
+    def feasible(self) -> bool:
+        return self._feasible
+
+    @property
+    def solved(self) -> bool:
+        return self._feasible and len(self._values) == len(self._watches)
+
+    def copy(self) -> Propagator:
+        """Copy the current state. Constraints are shared until either copy adds more.
+
+        Returns:
+            Propagator: The copy.
+        """
+        other = Propagator.__new__(Propagator)
+        other._rows = self._rows
+        other._watches = self._watches
+        other._values = dict(self._values)
+        other._feasible = self._feasible
+        return other
+
+    def add(self, constraints: Iterable[pl.LpConstraint]) -> bool:
+        """Add constraints and propagate them.
+
+        Args:
+            constraints (Iterable[pl.LpConstraint]): Constraints to add.
+
+        Raises:
+            ValueError: Raised when a constraint has an unknown sense.
+
+        Returns:
+            bool: False if a contradiction was found.
+        """
+        rows = list(self._rows)
+        watches = {v: list(ws) for v, ws in self._watches.items()}
+        queue = []
+        for constraint in constraints:
+            terms = tuple((v, c) for v, c in constraint.items() if c)
+            rhs = -constraint.constant
+            if constraint.sense == pl.LpConstraintLE:
+                new_rows = [(terms, rhs)]
+            elif constraint.sense == pl.LpConstraintGE:
+                new_rows = [(tuple((v, -c) for v, c in terms), -rhs)]
+            elif constraint.sense == pl.LpConstraintEQ:
+                new_rows = [(terms, rhs), (tuple((v, -c) for v, c in terms), -rhs)]
+            else:
+                raise ValueError(f"Unknown constraint sense: {constraint.sense}")
+            for row in new_rows:
+                for v, _ in row[0]:
+                    watches.setdefault(v, []).append(len(rows))
+                queue.append(len(rows))
+                rows.append(row)
+
+        self._rows = rows
+        self._watches = watches
+        self._feasible = self._feasible and self._propagate(queue)
+        return self._feasible
+
+    def search(self, node_limit: int = 100) -> bool | None:
+        """Search for an assignment satisfying all constraints.
+
+        Args:
+            node_limit (int): Maximum number of branching nodes to visit.
+
+        Returns:
+            bool | None: Whether an assignment exists, or None if the node limit was reached.
+        """
+        nodes = 0
+
+        def _search(state: Propagator) -> bool | None:
+            nonlocal nodes
+            if state.solved:
+                return True
+            nodes += 1
+            if nodes > node_limit:
+                return None
+            var = next(v for v in state._watches if v not in state._values)
+            for value in (1, 0):
+                child = state.copy()
+                child._values[var] = value
+                if child._propagate(list(child._watches[var])):
+                    result = _search(child)
+                    if result is not False:
+                        return result
+            return False
+
+        if not self._feasible:
+            return False
+        return _search(self)
+
+    def _propagate(self, queue: list[int]) -> bool:
+        # each row reads `sum(c * v) <= rhs`; a free variable whose coefficient exceeds
+        # the slack left by the minimum activity is forced to its minimizing value
+        while queue:
+            terms, rhs = self._rows[queue.pop()]
+            slack = rhs
+            free = []
+            for v, c in terms:
+                value = self._values.get(v)
+                if value is None:
+                    if c < 0:
+                        slack -= c
+                    free.append((v, c))
+                else:
+                    slack -= c * value
+            if slack < 0:
+                return False
+            for v, c in free:
+                if abs(c) > slack:
+                    self._values[v] = 0 if c > 0 else 1
+                    queue.extend(self._watches[v])
+        return True
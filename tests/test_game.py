@@ -204,3 +204,49 @@ def test_game_demo(game: StandardGame):
         ("Loot", StandardTerrain.MOUNTAIN, StandardDirection.WEST): 0.0,
         ("Loot", StandardTerrain.MOUNTAIN, StandardDirection.NORTHWEST): 0.0,
     }
+
+
+def test_game_find_conflict_consistent(game: StandardGame):
+    game._info.extend(
+        [
+            SingleInfo(player="Public", name="5B", present=True),
+            RangeInfo(player="A", terrain="M", start=1, end=5, amount=4),
+        ]
+    )
+    assert game.find_conflict() is None
+
+
+@pytest.mark.parametrize(
+    "info, expected",
+    [
+        (
+            [
+                SingleInfo(player="Public", name="5B", present=True),
+                RangeInfo(player="A", terrain="M", start=1, end=5, amount=4),
+                SingleInfo(player="A", name="1B", present=True),
+            ],
+            [1, 2],
+        ),
+        (
+            [
+                SingleInfo(player="Public", name="5B", present=True),
+                SingleInfo(player="B", name="5B", present=True),
+            ],
+            [0, 1],
+        ),
+        (
+            [
+                RangeInfo(player="A", terrain="B", start=1, end=1, amount=3),
+                RangeInfo(player="B", terrain="B", start=1, end=1, amount=3),
+                SingleInfo(player="D", name="3F", present=True),
+                RangeInfo(player="C", terrain="B", start=1, end=1, amount=3),
+            ],
+            [0, 1, 3],
+        ),
+    ],
+)
+def test_game_find_conflict_inconsistent(game: StandardGame, info: list, expected: list[int]):
+    game._info.extend(info)
+    game.solve()
+    assert game.get_result() == {k: 0.0 for k in game.get_result()}
+    assert game.find_conflict() == [info[i] for i in expected]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pulp as pl
+import pytest
+
+from loot_of_lima_solver.propagation import Propagator
+
+
+@pytest.fixture(scope="function")
+def variables():
+    return [pl.LpVariable(f"x{i}", cat="Binary") for i in range(4)]
+
+
+def test_propagator_fixes_variables(variables: list[pl.LpVariable]):
+    propagator = Propagator([pl.lpSum(variables) == 1, variables[0] >= 1])
+    assert propagator.feasible
+    assert propagator.solved
+
+
+def test_propagator_detects_contradiction(variables: list[pl.LpVariable]):
+    propagator = Propagator([pl.lpSum(variables) <= 1])
+    assert propagator.feasible
+    assert not propagator.add([variables[0] + variables[1] == 2])
+    assert not propagator.feasible
+
+
+def test_propagator_copy_is_independent(variables: list[pl.LpVariable]):
+    propagator = Propagator([pl.lpSum(variables) == 2])
+    other = propagator.copy()
+    assert not other.add([pl.lpSum(variables[:3]) == 0])
+    assert propagator.feasible
+    assert propagator.search() is True
+
+
+@pytest.mark.parametrize(
+    "node_limit, expected",
+    [
+        (1, None),
+        (100, False),
+    ],
+)
+def test_propagator_search(node_limit: int, expected: bool | None):
+    # pigeonhole: four items in three slots, which propagation alone cannot refute
+    x = {(i, j): pl.LpVariable(f"x{i}{j}", cat="Binary") for i in range(4) for j in range(3)}
+    propagator = Propagator(
+        [pl.lpSum(x[(i, j)] for j in range(3)) == 1 for i in range(4)]
+        + [pl.lpSum(x[(i, j)] for i in range(4)) <= 1 for j in range(3)]
+    )
+    assert propagator.feasible
+    assert propagator.search(node_limit) is expected